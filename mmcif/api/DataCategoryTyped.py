@@ -4,6 +4,9 @@
 # Original: 15-May-2021   jdw
 #
 # Update:
+#  15-Oct-2026   hoist cast and missing value lookups out of the row loops and cache attribute type details
+#  15-Oct-2026   copy input rows with a row-level rather than a deep copy
+#  15-Oct-2026   fetch attribute type details for all attributes of the object in one dictionary query
 ##
 """
 
@@ -13,9 +16,18 @@ A subclass of DataCategory including explicit typing.
 from __future__ import absolute_import
 
 import logging
+import weakref
+from collections import Counter, OrderedDict
 
 from mmcif.api.DataCategory import DataCategory
 
+try:
+    from math import isclose
+except ImportError:  # Python 2.7
+
+    def isclose(a, b, rel_tol=1e-09, abs_tol=0.0):
+        return abs(a - b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
+
 
 __docformat__ = "google en"
 __author__ = "John Westbrook"
@@ -25,16 +37,27 @@ __license__ = "Apache 2.0"
 
 logger = logging.getLogger(__name__)
 
+# CIF missing value markers
+_MISSING = frozenset((".", "?"))
+
+# Dictionary type and mandatory details by category shared across objects typed with the same dictionary API instance
+_attributeInfoCache = weakref.WeakKeyDictionary()
+
 
 class DataCategoryTyped(DataCategory):
     """A subclass of DataCategory with methods to apply explicit data typing."""
 
-    difficult_attributes = [
-        'concentration_range', 'pdb_chain_residue_range', 'axial_symmetry',
-        'concentration_range', 'point_symmetry', 'used_frames_per_image',
-        'temperature', 'pH', 
-
-    ]
+    difficult_attributes = frozenset(
+        [
+            "concentration_range",
+            "pdb_chain_residue_range",
+            "axial_symmetry",
+            "point_symmetry",
+            "used_frames_per_image",
+            "temperature",
+            "pH",
+        ]
+    )
 
     def __init__(
         self,
@@ -54,7 +77,8 @@ class DataCategoryTyped(DataCategory):
             dataCategoryObj (object): DataCategory object instance
             dictionaryApi (object, optional): instance of DictionaryApi class. Defaults to None.
             raiseExceptions (bool, optional): raise exceptions. Defaults to True.
-            copyInputData (bool, optional): make a new copy input data. Defaults to True.
+            copyInputData (bool, optional): make a new copy input data. Defaults to True.  Otherwise, the
+                rows of the input object are typed in place and are shared with this object.
             ignoreCastErrors (bool, optional): ignore data processing cast errors. Defaults to False.
             useCifUnknowns (bool, optional): use CIF style missing values ('.' and '?'). Defaults to True.
             missingValueString (str, optional): missing string value . Defaults to None.
@@ -62,13 +86,15 @@ class DataCategoryTyped(DataCategory):
             missingValueFloat (float, optional): missing float value. Defaults to None.
         """
         self.__dcObj = dataCategoryObj
+        # Typing replaces whole (immutable) values so a row-level copy of the input is sufficient
         super(DataCategoryTyped, self).__init__(
             self.__dcObj.getName(),
-            self.__dcObj.getAttributeList(),
-            self.__dcObj.data,
+            list(self.__dcObj.getAttributeList()) if copyInputData else self.__dcObj.getAttributeList(),
+            [list(row) for row in self.__dcObj.data] if copyInputData else self.__dcObj.data,
             raiseExceptions=raiseExceptions,
-            copyInputData=copyInputData,
+            copyInputData=False,
         )
+        self._copyInputData = copyInputData
         #
         self.__dApi = dictionaryApi
         self.__attributeTypeD = {}
@@ -83,7 +109,8 @@ class DataCategoryTyped(DataCategory):
 
     def applyTypes(self, ignoreCastErrors=False, useCifUnknowns=True, missingValueString=None, missingValueInteger=None, missingValueFloat=None):
         """Cast data types (string, integer, float) in the current object based on dictionary type details.
-        Missing values ('.' or '?') are set to None.
+        Missing values (None, '.' or '?') are set to '.' or '?' for mandatory and optional attributes when
+        CIF style missing values are used, otherwise to the missing value for the attribute data type.
 
         Raises:
             e: any exception
@@ -92,22 +119,41 @@ class DataCategoryTyped(DataCategory):
             bool: True for success or False otherwise
         """
         ok = False
+        missingValueD = {"integer": missingValueInteger, "float": missingValueFloat, "string": missingValueString}
         try:
             for ii, atName in enumerate(self.getAttributeList()):
-                # colValL = self.getColumn(ii)
                 dataType, isMandatory = self.__getAttributeInfo(atName)
-                missingValue = missingValueInteger if dataType == "integer" else missingValueFloat if dataType in ["integer", "float"] else missingValueString
-                #if atName == ''print(missingValue)
-                missingValue = missingValue if not useCifUnknowns else "." if isMandatory else "?"
-                for row in self.data:
-                    try:
-                        row[ii] = self.__castD[dataType](row[ii]) if row[ii] is not None and row[ii] not in [".", "?"] else missingValue
-                    except Exception as e:
-                        if not ignoreCastErrors:
-                            logger.error("Cast error %s %s (%s) %r %r", self.getName(), atName, dataType, row[ii], str(e))
-                        row[ii] = missingValue
+                missingValue = ("." if isMandatory else "?") if useCifUnknowns else missingValueD[dataType]
+                castFn = self.__castD[dataType]
+                if dataType == "string":
+                    # Values that are already strings are not recast, and repeated values share a single
+                    # string object within the column
+                    internD = {}
+                    for row in self.data:
+                        v = row[ii]
+                        try:
+                            if v is None or v in _MISSING:
+                                row[ii] = missingValue
+                            elif type(v) is str:
+                                row[ii] = internD.setdefault(v, v)
+                            else:
+                                row[ii] = castFn(v)
+                        except Exception as e:
+                            if not ignoreCastErrors:
+                                logger.error("Cast error %s %s (%s) %r %r", self.getName(), atName, dataType, v, str(e))
+                            row[ii] = missingValue
+                else:
+                    for row in self.data:
+                        v = row[ii]
+                        try:
+                            row[ii] = castFn(v) if v is not None and v not in _MISSING else missingValue
+                        except Exception as e:
+                            if not ignoreCastErrors:
+                                logger.error("Cast error %s %s (%s) %r %r", self.getName(), atName, dataType, v, str(e))
+                            row[ii] = missingValue
                 #
-                logger.debug("%s %s %r", self.getName(), atName, [row[ii] for row in self.data])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s %s %r", self.getName(), atName, [row[ii] for row in self.data])
                 self.__attributeTypeD[atName] = dataType
                 ok = True
         except Exception as e:
@@ -131,6 +177,18 @@ class DataCategoryTyped(DataCategory):
         except Exception:
             return None, None
 
+    def getColumnDict(self):
+        """Get the typed values of the current object organized by attribute (column).
+
+        With useCifUnknowns=False and default missing values, missing values are None and
+        the result can be passed directly to columnar consumers such as pyarrow.table()
+        or pandas.DataFrame().
+
+        Returns:
+            (OrderedDict): {attributeName: [typed values, ...], ...} in attribute order
+        """
+        return OrderedDict((atName, self.getColumn(ii)) for ii, atName in enumerate(self.getAttributeList()))
+
     def applyStringTypes(self):
         """Cast data types to strings in the current object.  Missing values are set to '?' and '.' for
         optional and mandatory attributes, respectively.
@@ -146,11 +204,11 @@ class DataCategoryTyped(DataCategory):
             for ii, atName in enumerate(self.getAttributeList()):
                 _, isMandatory = self.__getAttributeInfo(atName)
                 dataType = "string"
+                castFn = self.__castD[dataType]
+                missingValue = "." if isMandatory else "?"
                 for row in self.data:
-                    if row[ii] is None or row[ii] in [".", "?"]:
-                        row[ii] = "." if isMandatory else "?"
-                    else:
-                        row[ii] = self.__castD[dataType](row[ii])
+                    v = row[ii]
+                    row[ii] = missingValue if v is None or v in _MISSING else castFn(v)
                 #
                 self.__attributeTypeD[atName] = dataType
                 ok = True
@@ -190,26 +248,27 @@ class DataCategoryTyped(DataCategory):
             if not lenEq:
                 return [(atName, False) for atName in atNameComList]
             #
+            aIdxD = self.getAttributeIndexDict()
+            bIdxD = dcObj.getAttributeIndexDict()
             for atName in atNameComList:
                 dataType, _ = self.__getAttributeInfo(atName)
+                aVL = self.getColumn(aIdxD[atName])
+                bVL = dcObj.getColumn(bIdxD[atName])
+                same = True
                 if dataType in ["string", "integer"]:
-                    if ignoreOrder:
-                        same = sorted(self.getAttributeValueList(atName)) == sorted(dcObj.getAttributeValueList(atName))
-                    else:
-                        same = self.getAttributeValueList(atName) == dcObj.getAttributeValueList(atName)
+                    same = Counter(aVL) == Counter(bVL) if ignoreOrder else aVL == bVL
                 elif dataType in ["float"]:
-                    aVL = self.getAttributeValueList(atName)
-                    bVL = dcObj.getAttributeValueList(atName)
                     if ignoreOrder:
-                        for aV, bV in zip(sorted(aVL), sorted(bVL)):
-                            same = self.__isClose(aV, bV, relTol=floatRelTolerance, absTol=floatAbsTolerance)
-                            if not same:
-                                break
-                    else:
+                        # Missing values are compared apart from the sorted float values
+                        same = Counter(v for v in aVL if v is None or v in _MISSING) == Counter(v for v in bVL if v is None or v in _MISSING)
+                        aVL = sorted(v for v in aVL if v is not None and v not in _MISSING)
+                        bVL = sorted(v for v in bVL if v is not None and v not in _MISSING)
+                    if same:
                         for aV, bV in zip(aVL, bVL):
-                            same = self.__isClose(aV, bV, relTol=floatRelTolerance, absTol=floatAbsTolerance)
-                            if not same:
-                                logger.info("%s %s (rel=%r) (abs=%r) %r (%r)", self.getName(), atName, aV * floatRelTolerance, floatAbsTolerance, aV, abs(aV - bV))
+                            if not self.__isClose(aV, bV, relTol=floatRelTolerance, absTol=floatAbsTolerance):
+                                same = False
+                                if not ignoreOrder:
+                                    logger.info("%s %s (rel=%r) (abs=%r) %r (%r)", self.getName(), atName, aV * floatRelTolerance, floatAbsTolerance, aV, abs(aV - bV))
                                 break
                 rL.append((atName, same))
             #
@@ -228,13 +287,18 @@ class DataCategoryTyped(DataCategory):
         Returns:
             (string, bool): data type (string, integer or float) and mandatory code
         """
-        cifDataType = self.__dApi.getTypeCode(self.getName(), atName)
-        cifPrimitiveType = self.__dApi.getTypePrimitive(self.getName(), atName)
-        isMandatory = self.__dApi.getMandatoryCode(self.getName(), atName) in ["yes", "implicit", "implicit-ordinal"]
+        catName = self.getName()
+        typeD = _attributeInfoCache.setdefault(self.__dApi, {}).setdefault(catName, {})
+        if atName not in typeD:
+            # Fetch the details for this and any other uncached attributes of the current object in a single dictionary query
+            atNameL = [atName] + [at for at in self.getAttributeList() if at != atName and at not in typeD]
+            typeD.update(self.__dApi.getAttributeTypeDict(catName, atNameL))
+        cifDataType, cifPrimitiveType, mandatoryCode = typeD[atName]
+        isMandatory = mandatoryCode in ["yes", "implicit", "implicit-ordinal"]
         dataType = "integer" if "int" in cifDataType else "float" if cifPrimitiveType == "numb" else "string"
         if atName in self.difficult_attributes:
             # this attribute is known to cause Cast Errors, either because it
-            # has 'int' in it (e.g. point_symmetry) or because it is a range, 
+            # has 'int' in it (e.g. point_symmetry) or because it is a range,
             # (e.g. 'pdb_chain_residue_range')
             dataType = "string"
         return dataType, isMandatory
@@ -245,6 +309,6 @@ class DataCategoryTyped(DataCategory):
         elif aV is not None and bV is not None and aV == bV:
             return True
         elif isinstance(aV, (float)) and isinstance(bV, (float)):
-            return abs(aV - bV) <= max(relTol * max(abs(aV), abs(bV)), absTol)
+            return isclose(aV, bV, rel_tol=relTol, abs_tol=absTol)
         else:
             raise ValueError
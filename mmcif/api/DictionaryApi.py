@@ -21,6 +21,7 @@
 #  15-Aug-2019  jdw improve handling of dictionary and dictionary history categories for concatenated dictionaries
 #   6-Sep-2019  jdw cleanup enum details
 #   5-Apr-2021  jdw add getItemValueConditionDependentList()
+#  15-Oct-2026      add getAttributeTypeDict() returning type and mandatory details for all category attributes
 ##
 """
 Accessors for PDBx/mmCIF dictionary attributes -
@@ -641,10 +642,7 @@ class DictionaryApi(object):
         return None
 
     def getTypePrimitive(self, category, attribute):
-        code = self.getTypeCode(category, attribute)
-        if code in self.__typesDict:
-            return self.__typesDict[code][0]
-        return None
+        return self.__getTypePrimitiveFromCode(self.getTypeCode(category, attribute))
 
     def getTypeDetail(self, category, attribute):
         code = self.getTypeCode(category, attribute)
@@ -652,6 +650,22 @@ class DictionaryApi(object):
             return self.__typesDict[code][2]
         return None
 
+    def getAttributeTypeDict(self, category, attributeList=None):
+        """Return the data type code, primitive type and mandatory code for attributes of the input category.
+
+        Args:
+            category (str): category name
+            attributeList (list, optional): attribute names. Defaults to None for all attributes defined in the category.
+
+        Returns:
+            (OrderedDict): {attribute: (type code, primitive type, mandatory code), ...}
+        """
+        rD = OrderedDict()
+        for attribute in attributeList if attributeList is not None else self.getAttributeNameList(category):
+            code = self.getTypeCode(category, attribute)
+            rD[attribute] = (code, self.__getTypePrimitiveFromCode(code), self.getMandatoryCode(category, attribute))
+        return rD
+
     def getContextList(self, category, attribute):
         return self.__getList("ITEM_CONTEXT", category, attribute)
 
@@ -1144,6 +1158,11 @@ class DictionaryApi(object):
                             eS = [rv for rv in row]
         return eS
 
+    def __getTypePrimitiveFromCode(self, code):
+        if code in self.__typesDict:
+            return self.__typesDict[code][0]
+        return None
+
     def __getList(self, enumCode, category, attribute=None):
         """Return the list of unique values"""
         return list(set(self.__getListAll(enumCode, category, attribute)))
@@ -25,11 +25,7 @@ class BinaryCifWriter(object):
         'ma_qa_metric_local', 'ma_software_group', 'ma_target_entity', 
         'ma_target_entity_instance', 'ma_target_ref_db_details'
     ]
-    difficult_attributes = [
-        'concentration_range', 'pdb_chain_residue_range', 'axial_symmetry',
-        'concentration_range', 'point_symmetry', 'used_frames_per_image',
-        'temperature', 'pH',
-    ]
+    difficult_attributes = DataCategoryTyped.difficult_attributes
 
     def __init__(
         self, dictionaryApi, dictionaryApi_modelcif, 
@@ -55,6 +55,8 @@ def main():
         logger.info("Starting dictionary container list length (%d)", len(containerList))
         dIncl = DictionaryInclude(dirPath=dirPath)
         inclL = dIncl.processIncludedContent(containerList, cleanup=cleanup)
+        # Release the input containers so that any replaced by included content may be reclaimed before writing
+        del containerList
         logger.info("Processed dictionary container length (%d)", len(inclL))
         ok = myIo.writeFile(outputFilePath=outputDictPath, containerList=inclL)
         logger.info("Operation completed with status %r", ok)
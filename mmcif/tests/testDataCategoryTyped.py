@@ -0,0 +1,177 @@
+##
+#
+# File:    testDataCategoryTyped.py
+# Date:    15-Oct-2026
+#
+# Updates:
+##
+"""
+Test cases for typed data category containers.
+
+"""
+from __future__ import absolute_import
+
+import logging
+import os
+import sys
+import time
+import unittest
+
+from mmcif.api.DataCategory import DataCategory
+from mmcif.api.DataCategoryTyped import DataCategoryTyped
+from mmcif.api.DictionaryApi import DictionaryApi
+from mmcif.io.IoAdapterPy import IoAdapterPy as IoAdapter
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(HERE))
+
+try:
+    from mmcif import __version__
+except ImportError:
+    sys.path.insert(0, TOPDIR)
+    from mmcif import __version__
+
+
+__docformat__ = "google en"
+__author__ = "John Westbrook"
+__email__ = "john.westbrook@rcsb.org"
+__license__ = "Apache 2.0"
+
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class DataCategoryTypedTests(unittest.TestCase):
+    def setUp(self):
+        self.__pathPdbxDictionary = os.path.join(HERE, "data", "mmcif_pdbx_v5_next.dic")
+        myIo = IoAdapter(raiseExceptions=True)
+        self.__dApi = DictionaryApi(containerList=myIo.readFile(inputFilePath=self.__pathPdbxDictionary), consolidate=True)
+        #
+        self.__attributeList = ["group_PDB", "id", "type_symbol", "label_seq_id", "Cartn_x", "occupancy", "pdbx_formal_charge"]
+        self.__rowList = [
+            ["ATOM", "1", "O", "1", "18.935", "1.00", "?"],
+            ["ATOM", "2", "C", "1", "19.130", "?", "-1"],
+            ["HETATM", "3", "N", ".", "19.961", "0.50", "x"],
+        ]
+        self.__startTime = time.time()
+        logger.debug("Running tests on version %s", __version__)
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testApplyTypes(self):
+        """Test case - cast values using dictionary types with CIF style missing values"""
+        try:
+            dObj = DataCategory("atom_site", self.__attributeList, self.__rowList)
+            tObj = DataCategoryTyped(dObj, dictionaryApi=self.__dApi, ignoreCastErrors=True)
+            self.assertEqual(tObj.getRowCount(), 3)
+            self.assertEqual(tObj.getRow(0), ["ATOM", "1", "O", 1, 18.935, 1.0, "?"])
+            self.assertEqual(tObj.getRow(1), ["ATOM", "2", "C", 1, 19.13, "?", -1])
+            # mandatory missing values are '.' and cast failures are treated as missing
+            self.assertEqual(tObj.getRow(2), ["HETATM", "3", "N", ".", 19.961, 0.5, "?"])
+            self.assertEqual(tObj.getAttributeInfo("label_seq_id"), ("integer", True))
+            self.assertEqual(tObj.getAttributeInfo("occupancy"), ("float", False))
+            # repeated string values share a single object
+            rowList = [list(row) for row in self.__rowList]
+            rowList[1][0] = "".join(["AT", "OM"])
+            self.assertFalse(rowList[0][0] is rowList[1][0])
+            sObj = DataCategoryTyped(DataCategory("atom_site", self.__attributeList, rowList), dictionaryApi=self.__dApi, ignoreCastErrors=True)
+            self.assertTrue(sObj.getValue("group_PDB", 0) is sObj.getValue("group_PDB", 1))
+            # the input category is not modified by default
+            self.assertEqual(dObj.getRow(0), self.__rowList[0])
+            # otherwise the input rows are typed in place
+            tObj = DataCategoryTyped(dObj, dictionaryApi=self.__dApi, copyInputData=False, ignoreCastErrors=True)
+            self.assertEqual(dObj.getValue("label_seq_id", 0), 1)
+            self.assertEqual(dObj.getRow(2), tObj.getRow(2))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testApplyTypesMissingValues(self):
+        """Test case - cast values using dictionary types with explicit missing values"""
+        try:
+            dObj = DataCategory("atom_site", self.__attributeList, self.__rowList)
+            tObj = DataCategoryTyped(dObj, dictionaryApi=self.__dApi, ignoreCastErrors=True, useCifUnknowns=False, missingValueFloat=-1.0, missingValueInteger=-1)
+            self.assertEqual(tObj.getColumn(3), [1, 1, -1])
+            self.assertEqual(tObj.getColumn(5), [1.0, -1.0, 0.5])
+            self.assertEqual(tObj.getColumn(6), [-1, -1, -1])
+            #
+            colD = tObj.getColumnDict()
+            self.assertEqual(list(colD.keys()), self.__attributeList)
+            self.assertEqual(colD["Cartn_x"], [18.935, 19.13, 19.961])
+            #
+            ok = tObj.applyStringTypes()
+            self.assertTrue(ok)
+            self.assertEqual(tObj.getColumn(3), ["1", "1", "-1"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testCompareValues(self):
+        """Test case - compare typed values with and without regard to row order"""
+        try:
+            dObj = DataCategory("atom_site", self.__attributeList, self.__rowList)
+            tObj = DataCategoryTyped(dObj, dictionaryApi=self.__dApi, ignoreCastErrors=True)
+            rObj = DataCategoryTyped(DataCategory("atom_site", self.__attributeList, self.__rowList[::-1]), dictionaryApi=self.__dApi, ignoreCastErrors=True)
+            rL = tObj.cmpAttributeValues(rObj)
+            self.assertEqual(len(rL), len(self.__attributeList))
+            self.assertTrue(all([same for _, same in rL]))
+            #
+            rD = dict(tObj.cmpAttributeValues(rObj, ignoreOrder=False))
+            self.assertFalse(rD["id"])
+            self.assertFalse(rD["group_PDB"])
+            #
+            rowList = [list(row) for row in self.__rowList]
+            rowList[0][4] = "18.9351"
+            cObj = DataCategoryTyped(DataCategory("atom_site", self.__attributeList, rowList), dictionaryApi=self.__dApi, ignoreCastErrors=True)
+            rD = dict(tObj.cmpAttributeValues(cObj, ignoreOrder=False))
+            self.assertTrue(rD["Cartn_x"])
+            rD = dict(tObj.cmpAttributeValues(cObj, ignoreOrder=False, floatAbsTolerance=1.0e-05, floatRelTolerance=1.0e-08))
+            self.assertFalse(rD["Cartn_x"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testCompareValuesRaggedRows(self):
+        """Test case - compare common attribute values when rows are short in other attributes"""
+        try:
+            tObj = DataCategoryTyped(DataCategory("atom_site", ["id", "Cartn_x"], [["1", "18.935"]]), dictionaryApi=self.__dApi)
+            dObj = DataCategory("atom_site", ["id", "Cartn_x", "occupancy"], [["1", 18.935]])
+            for ignoreOrder in [True, False]:
+                rL = tObj.cmpAttributeValues(dObj, ignoreOrder=ignoreOrder)
+                self.assertEqual(sorted(rL), [("Cartn_x", True), ("id", True)])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testCompareValuesMixedNumbers(self):
+        """Test case - compare float values with integer values with and without regard to row order"""
+        try:
+            tObj = DataCategoryTyped(DataCategory("atom_site", ["Cartn_x"], [["2.0"], ["3.0"], ["?"]]), dictionaryApi=self.__dApi)
+            for rowList, expected in [([[3], [2], ["?"]], True), ([[2], [4.5], ["?"]], False), ([[2], [3], ["."]], False)]:
+                dObj = DataCategory("atom_site", ["Cartn_x"], rowList)
+                self.assertEqual(tObj.cmpAttributeValues(dObj), [("Cartn_x", expected)])
+            dObj = DataCategory("atom_site", ["Cartn_x"], [[2], [3], ["?"]])
+            self.assertEqual(tObj.cmpAttributeValues(dObj, ignoreOrder=False), [("Cartn_x", True)])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteTypedTests():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DataCategoryTypedTests("testApplyTypes"))
+    suiteSelect.addTest(DataCategoryTypedTests("testApplyTypesMissingValues"))
+    suiteSelect.addTest(DataCategoryTypedTests("testCompareValues"))
+    suiteSelect.addTest(DataCategoryTypedTests("testCompareValuesRaggedRows"))
+    suiteSelect.addTest(DataCategoryTypedTests("testCompareValuesMixedNumbers"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteTypedTests()
+    unittest.TextTestRunner(verbosity=2, descriptions=False).run(mySuite)
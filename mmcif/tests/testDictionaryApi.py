@@ -193,6 +193,29 @@ class DictionaryApiTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testAttributeTypeDict(self):
+        """Test case -  type and mandatory details for all category attributes"""
+
+        try:
+            myIo = IoAdapter(raiseExceptions=True)
+            self.__containerList = myIo.readFile(inputFilePath=self.__pathPdbxDictionary)
+            dApi = DictionaryApi(containerList=self.__containerList, consolidate=True, verbose=self.__verbose)
+            categoryName = "atom_site"
+            tD = dApi.getAttributeTypeDict(categoryName)
+            self.assertEqual(list(tD.keys()), dApi.getAttributeNameList(categoryName))
+            for attributeName, (code, primitive, mandatoryCode) in tD.items():
+                self.assertEqual(code, dApi.getTypeCode(categoryName, attributeName))
+                self.assertEqual(primitive, dApi.getTypePrimitive(categoryName, attributeName))
+                self.assertEqual(mandatoryCode, dApi.getMandatoryCode(categoryName, attributeName))
+            self.assertEqual(tD["Cartn_x"][1], "numb")
+            tD = dApi.getAttributeTypeDict(categoryName, ["id", "Cartn_x"])
+            self.assertEqual(list(tD.keys()), ["id", "Cartn_x"])
+            self.assertEqual(tD["id"][0], dApi.getTypeCode(categoryName, "id"))
+            self.assertEqual(dApi.getAttributeTypeDict("not_a_category"), {})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
     def testGetAdjacentCategories(self):
         """Test case -"""
 
@@ -244,6 +267,7 @@ def suiteDictionaryApiTests():
 def suiteConsolidateTests():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(DictionaryApiTests("testConsolidateDictionary"))
+    suiteSelect.addTest(DictionaryApiTests("testAttributeTypeDict"))
     return suiteSelect
 
 